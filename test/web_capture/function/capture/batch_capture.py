@@ -3,6 +3,7 @@
 """
 
 import asyncio
+from datetime import datetime
 from typing import List, Optional
 
 from ...config.config import logger
@@ -10,7 +11,7 @@ from ...models.models import CaptureConfig, CaptureResult
 from ...utils.utils import ensure_dir
 from ...utils.queue_manager import CaptureTask
 
-from .browser import get_browser, close_browser
+from .browser import get_browser, close_browser, run_sync
 from .page_capture import capture_single_page
 
 
@@ -29,6 +30,10 @@ async def capture_multiple_pages_async(
     """
     result = CaptureResult()
 
+    # 배치 전체가 공유하는 타임스탬프
+    # (URL마다 strftime을 반복하지 않고, 한 배치의 파일명이 같은 시각으로 묶임)
+    batch_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+
     # 출력 디렉토리 확인
     ensure_dir(config.output_dir)
 
@@ -50,18 +55,20 @@ async def capture_multiple_pages_async(
                 gif_duration=config.gif_duration,
                 gif_fps=config.gif_fps,
                 scroll_speed=config.scroll_speed,
+                wait_for_selector=config.wait_for_selector,
+                max_height=config.max_height,
+                batch_timestamp=batch_ts,
             )
             result.add_capture(capture)
 
-    # 모든 작업 생성
-    tasks = []
-    for url in urls:
-        for device_type in config.devices:
-            tasks.append(capture_with_semaphore(url, device_type))
-
-    # 모든 작업 실행
-    logger.info(f"{len(tasks)}개 캡처 작업 시작")
-    await asyncio.gather(*tasks)
+    # 모든 작업 생성 및 실행
+    # TaskGroup은 첫 치명적 오류 발생 시 나머지 작업을 즉시 취소함
+    # (개별 캡처 실패는 capture_single_page가 실패 결과로 흡수)
+    pairs = [(url, device_type) for url in urls for device_type in config.devices]
+    logger.info(f"{len(pairs)}개 캡처 작업 시작")
+    async with asyncio.TaskGroup() as tg:
+        for url, device_type in pairs:
+            tg.create_task(capture_with_semaphore(url, device_type))
 
     # 브라우저 종료
     await close_browser()
@@ -86,19 +93,16 @@ def process_capture_task(task: CaptureTask) -> Optional[object]:
         캡처 결과
     """
     try:
-        # 비동기 코드를 동기적으로 실행
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        capture = loop.run_until_complete(
+        # 공유 백그라운드 루프에서 비동기 코드 실행
+        return run_sync(
             capture_single_page(
-                url=task.url, device_type=task.device_type, output_dir=task.output_dir
+                url=task.url,
+                device_type=task.device_type,
+                output_dir=task.output_dir,
+                batch_timestamp=task.batch_timestamp,
             )
         )
 
-        loop.close()
-        return capture
-
     except Exception as e:
         logger.error(f"작업 처리 오류: {str(e)}")
         return None
@@ -120,12 +124,5 @@ def capture_multiple_pages(
     if config is None:
         config = CaptureConfig()
 
-    # 비동기 코드를 동기적으로 실행
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
-    try:
-        result = loop.run_until_complete(capture_multiple_pages_async(urls, config))
-        return result
-    finally:
-        loop.close()
+    # 공유 백그라운드 루프에서 비동기 코드 실행
+    return run_sync(capture_multiple_pages_async(urls, config))
@@ -3,14 +3,102 @@
 """
 
 import asyncio
-from typing import Optional
+import threading
+from typing import Any, Coroutine, Dict, Optional
 
-from playwright.async_api import async_playwright, Browser
+from playwright.async_api import async_playwright, Browser, BrowserContext
 from ...config.config import logger, load_config_from_env
+from ...models.models import DeviceType
+from ...utils.device_profiles import get_device_profile
 
 # 브라우저 싱글톤 인스턴스
 _browser_instance = None
 
+# Playwright 드라이버 핸들 (종료 시 stop() 호출용)
+_playwright_instance = None
+
+# 동시 초기화 방지 잠금
+# 병렬 캡처 시작 시 여러 태스크가 동시에 get_browser를 호출하면
+# 브라우저가 중복 실행되어 일부 인스턴스가 누수되는 것을 막음
+_browser_init_lock = asyncio.Lock()
+
+# 디바이스 유형별 컨텍스트 풀
+# new_page()마다 새 컨텍스트를 만드는 대신 디바이스 프로필이 적용된
+# 컨텍스트를 재사용하여 캡처당 초기화 비용을 제거
+_context_pool: Dict[DeviceType, "asyncio.Queue[BrowserContext]"] = {}
+
+# 페이지 로드 시점에 채널톡 메신저를 자동으로 숨기는 초기화 스크립트
+# 캡처 코드에서 페이지마다 evaluate + 대기하던 것을 컨텍스트 생성 시
+# 한 번 등록하는 것으로 대체 (페이지당 CDP 왕복 2회 제거)
+_HIDE_CHANNELIO_JS = """
+window.addEventListener('load', () => {
+    const hide = () => {
+        if (window.ChannelIO) {
+            try { window.ChannelIO('hideMessenger'); } catch (e) {}
+        }
+        const plugin = document.getElementById('ch-plugin');
+        if (plugin) plugin.style.display = 'none';
+    };
+    hide();
+    setTimeout(hide, 500);
+});
+"""
+
+# 인페이지 스크롤 드라이버
+# GIF 프레임 루프에서 키 입력/휠 이벤트/JS 스크롤을 번갈아 시도하던
+# 다단계 폴백을 페이지 안에서 한 번에 처리 (프레임당 CDP 왕복 1회)
+_SCROLL_DRIVER_JS = """
+window.__wc_scroll = (dy) => {
+    const prev = window.scrollY;
+    window.scrollBy({ top: dy, behavior: 'instant' });
+    if (window.scrollY === prev) {
+        window.dispatchEvent(
+            new WheelEvent('wheel', { deltaY: dy, bubbles: true })
+        );
+    }
+    return [prev, window.scrollY];
+};
+"""
+
+# 동기식 API가 공유하는 백그라운드 이벤트 루프
+# 호출마다 루프를 생성/폐기하는 비용을 없애고, 브라우저 싱글톤과
+# 컨텍스트 풀이 항상 같은 루프에 묶이도록 보장
+_runner_loop: Optional[asyncio.AbstractEventLoop] = None
+_runner_lock = threading.Lock()
+
+
+def _get_runner_loop() -> asyncio.AbstractEventLoop:
+    """백그라운드 이벤트 루프 가져오기 (없으면 데몬 스레드에서 시작)"""
+    global _runner_loop
+
+    with _runner_lock:
+        if _runner_loop is None or _runner_loop.is_closed():
+            _runner_loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=_runner_loop.run_forever,
+                name="web-capture-loop",
+                daemon=True,
+            )
+            thread.start()
+        return _runner_loop
+
+
+def run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    백그라운드 이벤트 루프에서 코루틴을 실행하고 결과 반환
+
+    동기식 API(capture_page, capture_multiple_pages 등)의 공통 진입점으로,
+    호출마다 new_event_loop를 만들던 기존 방식의 셀렉터/시그널 핸들러
+    초기화 비용을 제거합니다.
+
+    Args:
+        coro: 실행할 코루틴
+
+    Returns:
+        코루틴 실행 결과
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_runner_loop()).result()
+
 
 async def get_browser(browser_type: str = "chromium") -> Browser:
     """
@@ -22,33 +110,108 @@ async def get_browser(browser_type: str = "chromium") -> Browser:
     Returns:
         브라우저 인스턴스
     """
-    global _browser_instance
+    global _browser_instance, _playwright_instance
+
+    # 빠른 경로: 이미 초기화된 경우 잠금 없이 반환
+    if _browser_instance is not None:
+        return _browser_instance
 
-    if _browser_instance is None:
-        # 설정 로드
-        config = load_config_from_env()
+    async with _browser_init_lock:
+        # 잠금 대기 중 다른 태스크가 초기화를 끝냈을 수 있음
+        if _browser_instance is None:
+            # 설정 로드
+            config = load_config_from_env()
 
-        # Playwright 시작
-        playwright = await async_playwright().start()
+            # Playwright 시작
+            _playwright_instance = await async_playwright().start()
 
-        # 브라우저 선택
-        if browser_type == "firefox":
-            _browser_instance = await playwright.firefox.launch(headless=True)
-        elif browser_type == "webkit":
-            _browser_instance = await playwright.webkit.launch(headless=True)
-        else:
-            _browser_instance = await playwright.chromium.launch(headless=True)
+            # 브라우저 선택
+            if browser_type == "firefox":
+                _browser_instance = await _playwright_instance.firefox.launch(
+                    headless=True
+                )
+            elif browser_type == "webkit":
+                _browser_instance = await _playwright_instance.webkit.launch(
+                    headless=True
+                )
+            else:
+                _browser_instance = await _playwright_instance.chromium.launch(
+                    headless=True
+                )
 
-        logger.info(f"{browser_type} 브라우저 시작")
+            logger.info(f"{browser_type} 브라우저 시작")
 
     return _browser_instance
 
 
+async def acquire_context(device_type: DeviceType) -> BrowserContext:
+    """
+    디바이스 프로필이 적용된 브라우저 컨텍스트 가져오기 (풀 재사용)
+
+    컨텍스트 생성 시점에 뷰포트/UA/스케일이 적용되므로 페이지별
+    set_viewport_size, set_extra_http_headers 호출이 필요 없습니다.
+
+    Args:
+        device_type: 디바이스 유형
+
+    Returns:
+        브라우저 컨텍스트
+    """
+    pool = _context_pool.setdefault(device_type, asyncio.Queue())
+    if not pool.empty():
+        return pool.get_nowait()
+
+    browser = await get_browser()
+    profile = get_device_profile(device_type)
+    context = await browser.new_context(
+        viewport={"width": profile.width, "height": profile.height},
+        user_agent=profile.user_agent,
+        device_scale_factor=profile.device_scale_factor,
+        is_mobile=profile.is_mobile,
+        has_touch=profile.has_touch,
+    )
+
+    # 채널톡 메신저 자동 숨김 (모든 페이지에 적용)
+    await context.add_init_script(_HIDE_CHANNELIO_JS)
+
+    # 스크롤 드라이버 등록 (GIF 캡처에서 사용)
+    await context.add_init_script(_SCROLL_DRIVER_JS)
+
+    logger.debug(f"{device_type} 컨텍스트 생성")
+    return context
+
+
+async def release_context(device_type: DeviceType, context: BrowserContext) -> None:
+    """
+    사용 완료된 컨텍스트를 풀에 반환
+
+    Args:
+        device_type: 디바이스 유형
+        context: 반환할 컨텍스트
+    """
+    _context_pool.setdefault(device_type, asyncio.Queue()).put_nowait(context)
+
+
 async def close_browser():
     """브라우저 인스턴스 종료"""
-    global _browser_instance
+    global _browser_instance, _playwright_instance
+
+    # 풀에 남아있는 컨텍스트 정리
+    for pool in _context_pool.values():
+        while not pool.empty():
+            try:
+                await pool.get_nowait().close()
+            except Exception:
+                pass
+    _context_pool.clear()
+
+    async with _browser_init_lock:
+        if _browser_instance:
+            await _browser_instance.close()
+            _browser_instance = None
+            logger.info("브라우저 종료")
 
-    if _browser_instance:
-        await _browser_instance.close()
-        _browser_instance = None
-        logger.info("브라우저 종료")
+        # 드라이버 프로세스까지 함께 정리
+        if _playwright_instance:
+            await _playwright_instance.stop()
+            _playwright_instance = None
@@ -3,17 +3,174 @@
 """
 
 import io
+import os
+import shutil
+import base64
 import asyncio
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
 
 from playwright.async_api import Page
 from ...config.config import logger
 from ...models.models import CaptureConfig
+from .browser import _SCROLL_DRIVER_JS
+from .utils import wait_for_condition
+
+# 두 번의 rAF를 기다려 스크롤/렌더링이 화면에 반영되도록 보장하는 표현식
+_RENDER_SETTLE_JS = (
+    "() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))"
+)
+
+# GIF 인코딩 전용 프로세스 풀 (지연 생성)
+# Pillow의 디코딩/리사이즈/양자화는 GIL에 묶이므로 별도 프로세스에서
+# 실행해야 이벤트 루프의 다른 캡처 작업이 멈추지 않음
+_encode_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _png_to_jpeg(data: bytes, quality: int = 85) -> bytes:
+    """PNG 바이트를 JPEG로 변환 (워커 스레드에서 실행)
+
+    ffmpeg 파이프(mjpeg)는 단일 코덱 스트림이어야 하므로
+    PNG로 캡처한 첫 프레임을 파이프 전송용으로만 변환합니다.
+    """
+    from PIL import Image
+
+    buf = io.BytesIO()
+    Image.open(io.BytesIO(data)).convert("RGB").save(
+        buf, format="JPEG", quality=quality
+    )
+    return buf.getvalue()
+
+
+def _get_encode_pool() -> ProcessPoolExecutor:
+    """GIF 인코딩용 프로세스 풀 가져오기 (싱글톤)"""
+    global _encode_pool
+    if _encode_pool is None:
+        _encode_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _encode_pool
+
+
+def _encode_gif(frame_bytes: List[bytes], output_path: str, fps: int) -> str:
+    """
+    프레임 바이트 목록을 GIF 파일로 인코딩 (워커 프로세스에서 실행)
+
+    디코딩, 리사이즈, 팔레트 양자화, LZW 인코딩 전부를 이벤트 루프
+    밖에서 수행합니다.
+
+    Args:
+        frame_bytes: 캡처된 프레임의 원본 이미지 바이트 목록
+        output_path: 출력 GIF 파일 경로
+        fps: 초당 프레임 수
+
+    Returns:
+        생성된 GIF 파일 경로 (실패 시 빈 문자열)
+    """
+    import numpy as np
+    from PIL import Image
+
+    if not frame_bytes:
+        return ""
+
+    # 디코딩 단계에서 바로 목표 크기로 축소
+    # JPEG는 draft()로 DCT 도메인 1/2·1/4 선축소 디코딩을 활용하고,
+    # 이후 reducing_gap 리사이즈로 Lanczos 컨볼루션 비용을 줄임
+    target_w = 800
+
+    def decode_frame(data: bytes):
+        img = Image.open(io.BytesIO(data))
+        w, h = img.size
+        if w > target_w:  # 너무 넓은 경우 리사이즈
+            new_h = int(h * (target_w / w))
+            img.draft("RGB", (target_w, new_h))
+            return img.convert("RGB").resize(
+                (target_w, new_h), Image.LANCZOS, reducing_gap=2.0
+            )
+        return img.convert("RGB")
+
+    # 모든 프레임을 하나의 연속된 numpy 버퍼에 디코딩
+    # (프레임별 PIL 객체 보관 대비 메모리 단편화와 캐시 미스를 줄임)
+    first = np.asarray(decode_frame(frame_bytes[0]))
+    frame_h, frame_w = first.shape[:2]
+    frame_buf = np.empty((len(frame_bytes), frame_h, frame_w, 3), dtype=np.uint8)
+    frame_buf[0] = first
+    for i, data in enumerate(frame_bytes[1:], start=1):
+        frame_buf[i] = np.asarray(decode_frame(data))
+
+    # 저장 시점에만 PIL 객체로 래핑 (픽셀 버퍼는 공유됨)
+    frames = [Image.fromarray(frame_buf[i]) for i in range(len(frame_bytes))]
+
+    # libvips GIF 인코더 우선 사용 (cgif+libimagequant 기반)
+    # Pillow 인코더보다 수 배 빠르고 출력 파일도 작음. 미설치 시 Pillow 폴백.
+    try:
+        import pyvips
+
+        delay = int(1000 / fps)
+        vips_frames = [
+            pyvips.Image.new_from_array(np.asarray(frame)) for frame in frames
+        ]
+        joined = pyvips.Image.arrayjoin(vips_frames, across=1).copy()
+        joined.set_type(
+            pyvips.GValue.gint_type, "page-height", frames[0].size[1]
+        )
+        joined.set_type(pyvips.GValue.gint_type, "n-pages", len(frames))
+        joined.set_type(pyvips.GValue.gint_type, "loop", 0)
+        joined.set_type(
+            pyvips.GValue.array_int_type, "delay", [delay] * len(frames)
+        )
+        joined.gifsave(
+            output_path, effort=3, bitdepth=8, interframe_maxerror=0.5
+        )
+        return output_path
+    except ImportError:
+        pass
+    except Exception:
+        # pyvips 인코딩 실패 시 Pillow 경로로 폴백
+        pass
+
+    # 컬러 팔레트 최적화 시도
+    # 전역 팔레트를 한 번만 계산해 모든 프레임에 적용
+    # (optimize=True의 프레임별 팔레트 재계산을 제거하고 파일 크기도 감소)
+    try:
+        # 팔레트 표본은 전체 스크롤 구간을 대표해야 함 — 첫 프레임만
+        # 쓰면 폴드 아래에서 처음 등장하는 색이 팔레트에 없어 후반
+        # 프레임이 포스터라이즈되므로, 매 N번째 프레임을 수직으로
+        # 이어 붙인 스택에서 양자화
+        step = max(1, len(frame_bytes) // 8)
+        sample = np.concatenate(frame_buf[::step], axis=0)
+        master = Image.fromarray(sample).quantize(
+            colors=128, method=Image.MEDIANCUT
+        )
+        palette_frames = [
+            frame.quantize(palette=master, dither=Image.FLOYDSTEINBERG)
+            for frame in frames
+        ]
+        palette_frames[0].save(
+            output_path,
+            format="GIF",
+            save_all=True,
+            append_images=palette_frames[1:],
+            duration=int(1000 / fps),  # 밀리초 단위
+            loop=0,  # 무한 반복
+            optimize=False,
+            disposal=2,  # 각 프레임을 독립적으로 디코딩 가능하게 유지
+        )
+    except Exception:
+        # 컬러 옵션 제외하고 다시 시도
+        frames[0].save(
+            output_path,
+            format="GIF",
+            save_all=True,
+            append_images=frames[1:],
+            duration=int(1000 / fps),
+            loop=0,
+        )
+
+    return output_path
 
 
 async def create_scrolling_gif(
     page: Page, url: str, output_path: str, config: CaptureConfig
-) -> str:
+) -> Tuple[str, Optional[bytes]]:
     """
     페이지를 방향키로 스크롤하면서 GIF 생성
 
@@ -24,38 +181,60 @@ async def create_scrolling_gif(
         config: 캡처 설정
 
     Returns:
-        생성된 GIF 파일 경로
+        (생성된 GIF 파일 경로, 첫 프레임 이미지 바이트) 튜플.
+        첫 프레임은 스크롤 전 초기 화면이므로 메인 스크린샷으로 재사용 가능
     """
-    try:
-        # Pillow 라이브러리 import (필요시 pip install Pillow)
-        from PIL import Image
+    first_frame_bytes = None
+    proc = None
 
+    try:
         logger.info(f"GIF 생성 시작 (방향키 스크롤): {output_path}")
 
+        # ffmpeg가 있으면 프레임을 파이프로 바로 흘려보내 인코딩
+        # (프레임 전체를 메모리에 유지하지 않아 RSS가 평탄하게 유지됨)
+        ffmpeg_bin = shutil.which("ffmpeg")
+        if ffmpeg_bin:
+            proc = await asyncio.create_subprocess_exec(
+                ffmpeg_bin,
+                "-y",
+                "-loglevel", "error",
+                "-f", "image2pipe",
+                "-vcodec", "mjpeg",
+                "-r", str(config.gif_fps),
+                "-i", "-",
+                "-vf",
+                "scale=800:-1:flags=lanczos,"
+                "split[s0][s1];[s0]palettegen[p];[s1][p]paletteuse",
+                "-loop", "0",
+                output_path,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+
         # 총 프레임 수 계산
         total_frames = int(config.gif_duration * config.gif_fps)
 
-        # 페이지 맨 위로 스크롤
+        # 페이지 맨 위로 스크롤 후 안정화 대기 (조건 충족 시 즉시 진행)
         await page.evaluate("window.scrollTo(0, 0)")
-        await asyncio.sleep(2.0)  # 초기 대기 시간 증가 (페이지 안정화)
-
-        # 채널톡 메신저 닫기 시도
+        await wait_for_condition(page, "window.scrollY === 0", 1000)
         try:
-            await page.evaluate("window.ChannelIO('hideMessenger')")
-            logger.info("GIF 생성 전 채널톡 메신저 닫기 실행")
-            await asyncio.sleep(0.5)
-        except Exception as e:
-            logger.warning(f"GIF 생성 전 채널톡 메신저 닫기 실패 (무시)")
+            await page.wait_for_load_state("networkidle", timeout=2000)
+        except Exception:
+            logger.debug("네트워크 안정화 대기 시간 초과 (계속 진행)")
+
+        # 채널톡 메신저는 컨텍스트 초기화 스크립트가 자동으로 숨김
 
         # 이스케이프 키 눌러서 모달 닫기 (만약 있다면)
         await page.keyboard.press("Escape")
-        await asyncio.sleep(0.5)
+        await wait_for_condition(
+            page, "!document.querySelector('.modal.open, [role=\"dialog\"]')", 500
+        )
 
-        # 페이지 중앙 클릭하여 포커스 얻기
-        width = await page.evaluate("window.innerWidth")
-        height = await page.evaluate("window.innerHeight")
+        # 페이지 중앙 클릭하여 포커스 얻기 (뷰포트 크기는 한 번의 호출로 조회)
+        width, height = await page.evaluate("[window.innerWidth, window.innerHeight]")
         await page.mouse.click(width // 2, height // 2)
-        await asyncio.sleep(0.5)
+        await wait_for_condition(page, "document.hasFocus()", 300)
 
         # document 요소에 포커스
         await page.evaluate(
@@ -66,8 +245,47 @@ async def create_scrolling_gif(
         """
         )
 
-        # 프레임 캡처를 위한 설정
-        frames = []
+        # ffmpeg 미사용 시: 프레임은 원본 바이트 그대로 보관하고
+        # 디코딩/인코딩은 프로세스 풀의 워커에 일괄 위임 (이벤트 루프 비차단)
+        frame_bytes: List[bytes] = []
+
+        async def emit_frame(data: bytes) -> None:
+            """프레임을 ffmpeg 파이프로 전송하거나 버퍼에 보관"""
+            if proc:
+                proc.stdin.write(data)
+                await proc.stdin.drain()
+            else:
+                frame_bytes.append(data)
+
+        # 프레임 루프 전용 CDP 세션
+        # page.screenshot의 인자 정리/경로 처리 래퍼를 우회하여
+        # 프레임당 수 ms의 Python 측 오버헤드 제거 (chromium 전용)
+        cdp = None
+        try:
+            cdp = await page.context.new_cdp_session(page)
+        except Exception:
+            logger.debug("CDP 세션 생성 실패 — page.screenshot으로 진행")
+
+        # 스크롤 드라이버 보장
+        # acquire_context 풀 밖에서 만들어진 페이지(공개 API로 직접 전달된
+        # 경우)에는 컨텍스트 초기화 스크립트가 없으므로 여기서 설치
+        await page.evaluate(
+            "() => { if (typeof window.__wc_scroll === 'undefined') {"
+            + _SCROLL_DRIVER_JS
+            + "} }"
+        )
+
+        async def grab_frame(fmt: str, quality: Optional[int] = None) -> bytes:
+            """뷰포트 스크린샷 캡처 (가능하면 CDP 직접 호출)"""
+            if cdp:
+                params = {"format": fmt, "captureBeyondViewport": False}
+                if quality is not None:
+                    params["quality"] = quality
+                res = await cdp.send("Page.captureScreenshot", params)
+                return base64.b64decode(res["data"])
+            if fmt == "png":
+                return await page.screenshot(type="png")
+            return await page.screenshot(type="jpeg", quality=quality)
 
         # 키 입력 횟수 계산
         key_presses = max(20, total_frames // 3)  # 더 많은 키 입력 (최소 20회)
@@ -82,75 +300,56 @@ async def create_scrolling_gif(
         # 스크롤 카운터
         scroll_count = 0
 
-        # 직접 스크롤 JS 명령 시도 횟수
-        js_scroll_attempts = 0
+        # 스크롤이 움직이지 않은 횟수 (스크롤 양 점증에 사용)
+        stall_count = 0
+
+        # 마지막으로 확인한 스크롤 위치 (로깅용 — 프레임마다 재조회하지 않음)
+        last_scroll_y = 0
 
         # 각 프레임 캡처 (맨 처음 프레임은 스크롤 없이 캡처)
-        screenshot_bytes = await page.screenshot(type="png")
-        image = Image.open(io.BytesIO(screenshot_bytes))
-        frames.append(image)
+        # 첫 프레임은 메인 스크린샷(.png)으로 재사용되므로 항상 무손실
+        # PNG로 캡처하고, ffmpeg 파이프(mjpeg)에는 JPEG 변환본만 전송
+        screenshot_bytes = await grab_frame("png")
+        first_frame_bytes = screenshot_bytes
+        if proc:
+            await emit_frame(await asyncio.to_thread(_png_to_jpeg, screenshot_bytes))
+        else:
+            await emit_frame(screenshot_bytes)
         logger.debug(f"GIF 프레임 1/{total_frames} 캡처 완료 (초기 화면)")
 
         # 나머지 프레임 캡처
         for i in range(1, total_frames):
             curr_frame = i + 1
 
-            # 프레임마다 스크롤 시도 (다양한 방법으로)
+            # 프레임마다 스크롤 시도
             if i % (total_frames // key_presses) == 0 and scroll_count < key_presses:
                 scroll_count += 1
-                js_scroll_attempts += 1
-
-                # 다양한 스크롤 방법 시도 (스크롤 위치 저장)
-                prev_scroll_pos = await page.evaluate("window.scrollY")
-
-                # 방법 1: 단일 키 입력
-                key_to_press = ["ArrowDown", "PageDown", "Space"][scroll_count % 3]
-                await page.keyboard.press(key_to_press)
-                logger.debug(f"키 입력: {key_to_press}")
-                await asyncio.sleep(0.2)
-
-                # 스크롤 위치 변화 확인
-                new_scroll_pos = await page.evaluate("window.scrollY")
-                scroll_change = new_scroll_pos - prev_scroll_pos
-
-                # 스크롤이 효과가 없으면 다른 방법 시도
-                if scroll_change < 10 and js_scroll_attempts <= 5:
-                    # 방법 2: JS로 직접 스크롤
-                    scroll_amount = 300 * (
-                        js_scroll_attempts * 0.5 + 1
-                    )  # 점점 더 크게 스크롤
-                    await page.evaluate(f"window.scrollBy(0, {scroll_amount})")
-                    logger.debug(f"JS 스크롤: {scroll_amount}px")
-                    await asyncio.sleep(0.2)
-
-                # 여전히 스크롤이 안 되면 마우스 휠 이벤트 발생
-                new_scroll_pos = await page.evaluate("window.scrollY")
+
+                # 컨텍스트 초기화 스크립트가 등록한 인페이지 드라이버 호출
+                # (scrollBy + 휠 이벤트 폴백을 페이지 안에서 처리하므로
+                # 키 입력/휠/위치 조회를 번갈아 하던 CDP 왕복이 1회로 축소)
+                scroll_amount = 300 * (stall_count * 0.5 + 1)  # 정체 시 점증
+                prev_scroll_pos, new_scroll_pos = await page.evaluate(
+                    "(dy) => window.__wc_scroll(dy)", scroll_amount
+                )
                 if new_scroll_pos == prev_scroll_pos:
-                    # 방법 3: 마우스 휠 이벤트
-                    await page.mouse.wheel(0, 300)
-                    logger.debug("마우스 휠 이벤트 발생")
-                    await asyncio.sleep(0.2)
-
-                    # 방법 4: 복합 키 이벤트 시뮬레이션
-                    if js_scroll_attempts % 2 == 0:
-                        # 탭 키로 포커스 이동 후 스페이스바
-                        await page.keyboard.press("Tab")
-                        await asyncio.sleep(0.1)
-                        await page.keyboard.press("Space")
-                        logger.debug("탭 + 스페이스바")
-
-                # 키 입력 후 약간 대기 (스크롤 효과 적용)
-                await asyncio.sleep(0.3)
+                    stall_count += 1
+                logger.debug(f"스크롤: {prev_scroll_pos}px → {new_scroll_pos}px")
+
+                # 스크롤 효과가 화면에 반영될 때까지 대기
+                await page.evaluate(_RENDER_SETTLE_JS)
+                last_scroll_y = new_scroll_pos
 
             # 스크린샷 캡처
-            screenshot_bytes = await page.screenshot(type="png")
-            image = Image.open(io.BytesIO(screenshot_bytes))
-            frames.append(image)
+            # GIF 팔레트 양자화의 중간 입력일 뿐이므로 PNG 대신
+            # 인코딩/디코딩이 훨씬 저렴한 JPEG 사용
+            screenshot_bytes = await grab_frame("jpeg", quality=85)
+            await emit_frame(screenshot_bytes)
 
-            # 현재 스크롤 위치 로깅
-            scroll_y = await page.evaluate("window.scrollY")
+            # 현재 스크롤 위치 로깅 (마지막 스크롤 시점의 값을 재사용하여
+            # 프레임마다 발생하던 CDP 왕복 제거)
             logger.debug(
-                f"GIF 프레임 {curr_frame}/{total_frames} 캡처 완료 (스크롤 위치: {scroll_y}px)"
+                f"GIF 프레임 {curr_frame}/{total_frames} 캡처 완료 (스크롤 위치: {last_scroll_y}px)"
             )
 
             # 프레임 간 간격 유지
@@ -165,51 +364,50 @@ async def create_scrolling_gif(
         # 페이지를 맨 위로 다시 스크롤
         await page.evaluate("window.scrollTo(0, 0)")
 
-        # GIF 저장
-        if frames:
-            # 이미지 최적화: 크기와 색상 수 줄이기
-            for idx, frame in enumerate(frames):
-                if frame.size[0] > 800:  # 너무 넓은 경우 리사이즈
-                    ratio = 800 / frame.size[0]
-                    new_height = int(frame.size[1] * ratio)
-                    frames[idx] = frame.resize((800, new_height), Image.LANCZOS)
-
-            # 기본 GIF 저장 속성
-            gif_options = {
-                "format": "GIF",
-                "save_all": True,
-                "append_images": frames[1:],
-                "duration": int(1000 / config.gif_fps),  # 밀리초 단위
-                "loop": 0,  # 무한 반복
-                "optimize": True,  # 파일 크기 최적화
-            }
-
-            # 컬러 팔레트 최적화 시도
+        # CDP 세션 정리
+        if cdp:
             try:
-                frames[0].save(output_path, **gif_options)
-            except Exception as e:
-                logger.warning(f"최적화된 GIF 저장 실패, 기본 설정으로 시도: {str(e)}")
-                # 컬러 옵션 제외하고 다시 시도
-                frames[0].save(
-                    output_path,
-                    format="GIF",
-                    save_all=True,
-                    append_images=frames[1:],
-                    duration=int(1000 / config.gif_fps),
-                    loop=0,
-                )
+                await cdp.detach()
+            except Exception:
+                pass
+
+        # ffmpeg 파이프 종료 및 인코딩 완료 대기
+        if proc:
+            proc.stdin.close()
+            await proc.wait()
+            if proc.returncode == 0:
+                logger.info(f"GIF 생성 완료: {output_path}")
+                return output_path, first_frame_bytes
+            logger.error(f"GIF 생성 실패: ffmpeg 종료 코드 {proc.returncode}")
+            return "", first_frame_bytes
+
+        # GIF 저장 (인코딩은 프로세스 풀에서 수행하여 이벤트 루프 비차단)
+        if frame_bytes:
+            loop = asyncio.get_running_loop()
+            saved_path = await loop.run_in_executor(
+                _get_encode_pool(),
+                _encode_gif,
+                frame_bytes,
+                output_path,
+                config.gif_fps,
+            )
+            if saved_path:
+                logger.info(f"GIF 생성 완료: {saved_path}")
+                return saved_path, first_frame_bytes
 
-            logger.info(f"GIF 생성 완료: {output_path}")
-            return output_path
+            logger.error("GIF 생성 실패: 인코딩 결과 없음")
+            return "", first_frame_bytes
         else:
             logger.error("GIF 생성 실패: 캡처된 프레임 없음")
-            return ""
+            return "", None
 
     except ImportError:
         logger.error(
             "GIF 생성 실패: PIL 라이브러리가 설치되지 않음. 'pip install Pillow' 명령으로 설치하세요."
         )
-        return ""
+        return "", first_frame_bytes
     except Exception as e:
         logger.error(f"GIF 생성 오류: {str(e)}")
-        return ""
+        if proc and proc.returncode is None:
+            proc.kill()
+        return "", first_frame_bytes
@@ -5,7 +5,8 @@
 import os
 import asyncio
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from playwright.async_api import Page
 
@@ -14,15 +15,54 @@ from ...models.models import DeviceType, PageCapture
 from ...utils.device_profiles import get_device_profile
 from ...utils.utils import normalize_url, generate_filename, ensure_dir
 
-from .browser import get_browser
+from .browser import acquire_context, release_context, run_sync
 from .gif_generator import create_scrolling_gif
+from .utils import wait_for_condition
+
+
+def _write_png(path: str, data: bytes) -> None:
+    """이미지 바이트를 PNG 파일로 저장 (워커 스레드에서 실행)
+
+    GIF 첫 프레임이 JPEG로 캡처된 경우(ffmpeg 파이프 경로) PNG로 변환합니다.
+    """
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        with open(path, "wb") as f:
+            f.write(data)
+    else:
+        import io
+        from PIL import Image
+
+        Image.open(io.BytesIO(data)).convert("RGB").save(path, format="PNG")
+
+
+@lru_cache(maxsize=8192)
+def _compose_paths(
+    url: str, device: str, output_dir: str, timestamp: str
+) -> Tuple[str, str, str]:
+    """
+    캡처 출력 경로 조합 (캐시됨)
+
+    배치 작업에서는 같은 URL이 디바이스별로 반복 캡처되므로
+    해시/경로 계산 결과를 재사용합니다. 호출 전에 타임스탬프를
+    확정해서 전달해야 합니다 — None을 키로 캐시하면 최초 호출
+    시각이 고정되어 이후 캡처가 같은 경로를 덮어쓰게 됩니다.
+
+    Returns:
+        (파일명, PNG 경로, GIF 경로) 튜플
+    """
+    filename = generate_filename(url, device, timestamp=timestamp)
+    return (
+        filename,
+        os.path.join(output_dir, f"{filename}.png"),
+        os.path.join(output_dir, f"{filename}_scroll.gif"),
+    )
 
 
 async def capture_single_page(
     url: str,
     device_type: DeviceType,
     output_dir: str,
-    wait_time: float = 2.0,
+    wait_time: float = 0.5,
     scroll_page: bool = False,
     viewport_only: bool = True,
     max_retries: int = 2,
@@ -31,6 +71,9 @@ async def capture_single_page(
     gif_duration: float = 5.0,
     gif_fps: int = 10,
     scroll_speed: float = 1.0,
+    wait_for_selector: Optional[str] = None,
+    max_height: Optional[int] = None,
+    batch_timestamp: Optional[str] = None,
 ) -> PageCapture:
     """
     단일 페이지 캡처
@@ -48,15 +91,20 @@ async def capture_single_page(
         gif_duration: GIF 지속 시간(초)
         gif_fps: GIF 프레임 레이트
         scroll_speed: 스크롤 속도 배율
+        wait_for_selector: 캡처 전 출현을 기다릴 CSS 선택자
+        max_height: 스크롤 캡처 시 스크롤할 최대 높이 (픽셀, None이면 전체)
+        batch_timestamp: 배치 전체가 공유하는 타임스탬프 문자열
+            (None이면 파일명 생성 시 현재 시각 사용)
 
     Returns:
         캡처 결과 객체
     """
-    browser = None
+    context = None
     page = None
     retry_count = 0
     error_msg = None
     gif_path = None
+    first_frame_bytes = None
 
     # 디바이스 프로필 가져오기
     device_profile = get_device_profile(device_type)
@@ -68,57 +116,59 @@ async def capture_single_page(
         # 출력 디렉토리 생성
         ensure_dir(output_dir)
 
-        # 파일명 생성
-        filename = generate_filename(url, device_type.value)
-        file_path = os.path.join(output_dir, f"{filename}.png")
-
-        # GIF 파일 경로 생성
-        gif_filename = None
+        # 파일명 및 출력 경로 생성 (캐시된 조합 사용)
+        # 배치 타임스탬프가 없으면 캡처마다 현재 시각으로 확정
+        # (캐시 키에 None이 들어가 경로가 고정되는 것을 방지)
+        timestamp = batch_timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename, file_path, gif_file_path = _compose_paths(
+            url, device_type.value, output_dir, timestamp
+        )
         if create_gif:
-            gif_filename = f"{filename}_scroll.gif"
-            gif_path = os.path.join(output_dir, gif_filename)
+            gif_path = gif_file_path
 
-        # 브라우저 가져오기
-        browser = await get_browser()
+        # 디바이스 프로필이 적용된 컨텍스트 가져오기 (풀 재사용)
+        # 뷰포트/UA는 컨텍스트 생성 시 설정되므로 페이지별 재설정 불필요
+        context = await acquire_context(device_type)
 
         while retry_count <= max_retries:
             try:
                 # 페이지 생성
-                page = await browser.new_page()
-
-                # 뷰포트 및 디바이스 설정
-                await page.set_viewport_size(
-                    {"width": device_profile.width, "height": device_profile.height}
-                )
-
-                # 유저 에이전트 설정
-                if device_profile.user_agent:
-                    await page.set_extra_http_headers(
-                        {"User-Agent": device_profile.user_agent}
-                    )
+                page = await context.new_page()
 
                 # 페이지 로딩
+                # networkidle은 분석 스크립트 폴링 때문에 느리고 불안정하므로
+                # domcontentloaded 후 load 이벤트를 제한 시간 내에서만 대기
                 logger.info(f"페이지 로딩 중: {normalized_url} ({device_type})")
                 await page.goto(
-                    normalized_url, timeout=timeout * 1000, wait_until="networkidle"
+                    normalized_url,
+                    timeout=timeout * 1000,
+                    wait_until="domcontentloaded",
                 )
+                try:
+                    await page.wait_for_load_state("load", timeout=5000)
+                except Exception:
+                    logger.debug("load 이벤트 대기 시간 초과 (계속 진행)")
+
+                # 지정된 선택자가 있으면 해당 요소 출현까지 대기
+                if wait_for_selector:
+                    try:
+                        await page.wait_for_selector(wait_for_selector, timeout=5000)
+                    except Exception:
+                        logger.warning(
+                            f"선택자 대기 시간 초과 (계속 진행): {wait_for_selector}"
+                        )
 
                 # 추가 대기 시간
                 await asyncio.sleep(wait_time)
 
-                # 채널톡 메신저 닫기
-                try:
-                    await page.evaluate("window.ChannelIO('hideMessenger')")
-                    logger.info("채널톡 메신저 닫기 실행")
-                    await asyncio.sleep(0.5)  # 실행 후 약간의 대기 시간
-                except Exception as e:
-                    logger.warning(f"채널톡 메신저 닫기 실패 (무시하고 계속 진행)")
+                # 채널톡 메신저는 컨텍스트 초기화 스크립트가 자동으로 숨김
+                # (browser.acquire_context 참고)
 
                 # GIF 생성
                 if create_gif:
                     from ...models.models import CaptureConfig
 
-                    gif_path = await create_scrolling_gif(
+                    gif_path, first_frame_bytes = await create_scrolling_gif(
                         page=page,
                         url=normalized_url,
                         output_path=gif_path,
@@ -130,7 +180,7 @@ async def capture_single_page(
                     )
                     # GIF 생성 후 페이지 맨 위로 스크롤
                     await page.evaluate("window.scrollTo(0, 0)")
-                    await asyncio.sleep(0.5)
+                    await wait_for_condition(page, "window.scrollY === 0", 500)
 
                 # 스크린샷 옵션 설정
                 screenshot_options = {
@@ -140,17 +190,36 @@ async def capture_single_page(
 
                 # 스크롤 캡처
                 if scroll_page and not viewport_only and not create_gif:
-                    # 페이지 스크롤 및 로딩 대기
-                    for scroll_pos in range(0, 10000, device_profile.height):
-                        await page.evaluate(f"window.scrollTo(0, {scroll_pos})")
-                        await asyncio.sleep(0.2)
+                    # 실제 페이지 높이만큼만 스크롤하며 렌더링 완료를 rAF로 대기
+                    # (한 번의 evaluate 호출로 처리하여 왕복 통신 최소화)
+                    # max_height가 지정되면 무한 스크롤 페이지에서도
+                    # 해당 높이까지만 스크롤하여 캡처 시간을 제한
+                    await page.evaluate(
+                        """async ([step, maxHeight]) => {
+                            const nextFrame = () =>
+                                new Promise((r) => requestAnimationFrame(r));
+                            let total = document.body.scrollHeight;
+                            if (maxHeight) total = Math.min(total, maxHeight);
+                            for (let y = 0; y < total; y += step) {
+                                window.scrollTo(0, y);
+                                await nextFrame();
+                                await nextFrame();
+                            }
+                        }""",
+                        [device_profile.height, max_height],
+                    )
 
                     # 페이지 맨 위로 스크롤
                     await page.evaluate("window.scrollTo(0, 0)")
-                    await asyncio.sleep(0.5)
+                    await wait_for_condition(page, "window.scrollY === 0", 500)
 
                 # 스크린샷 촬영
-                await page.screenshot(**screenshot_options)
+                # (GIF 첫 프레임이 동일한 초기 화면이므로 뷰포트 캡처면 재사용)
+                if viewport_only and first_frame_bytes:
+                    # 파일 쓰기는 워커 스레드에서 수행 (이벤트 루프 비차단)
+                    await asyncio.to_thread(_write_png, file_path, first_frame_bytes)
+                else:
+                    await page.screenshot(**screenshot_options)
                 logger.info(f"캡처 완료: {filename}.png")
 
                 # 성공적인 캡처 결과 반환
@@ -192,9 +261,11 @@ async def capture_single_page(
         logger.error(f"캡처 오류: {error_msg}")
 
     finally:
-        # 페이지 닫기
+        # 페이지 닫기 및 컨텍스트 반환
         if page:
             await page.close()
+        if context:
+            await release_context(device_type, context)
 
     # 실패한 경우
     return PageCapture(
@@ -225,16 +296,9 @@ def capture_page(
     Returns:
         캡처 결과
     """
-    # 비동기 코드를 동기적으로 실행
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
-    try:
-        capture = loop.run_until_complete(
-            capture_single_page(
-                url=url, device_type=device_type, output_dir=output_dir, **kwargs
-            )
+    # 공유 백그라운드 루프에서 비동기 코드 실행
+    return run_sync(
+        capture_single_page(
+            url=url, device_type=device_type, output_dir=output_dir, **kwargs
         )
-        return capture
-    finally:
-        loop.close()
+    )
@@ -15,6 +15,26 @@ from playwright.async_api import Page, Error as PlaywrightError
 from ...config.config import logger
 
 
+async def wait_for_condition(
+    page: Page, expression: str, timeout_ms: int = 500
+) -> None:
+    """
+    JS 조건식이 참이 될 때까지 대기 (시간 초과 시 무시하고 진행)
+
+    고정 sleep 대신 실제 기다리는 조건을 명시하면 빠르게 안정화되는
+    페이지는 즉시 다음 단계로 진행할 수 있습니다.
+
+    Args:
+        page: Playwright 페이지 객체
+        expression: 평가할 JS 조건식
+        timeout_ms: 최대 대기 시간 (밀리초)
+    """
+    try:
+        await page.wait_for_function(expression, timeout=timeout_ms)
+    except Exception:
+        pass
+
+
 async def close_popups(page: Page) -> None:
     """
     웹페이지에서 일반적인 팝업/모달 닫기 시도
@@ -29,13 +49,20 @@ async def close_popups(page: Page) -> None:
         try:
             await page.evaluate("window.ChannelIO && window.ChannelIO('hideMessenger')")
             logger.debug("채널톡 메신저 닫기 시도")
-            await asyncio.sleep(0.3)
+            await wait_for_condition(
+                page,
+                "!document.getElementById('ch-plugin')"
+                " || !document.getElementById('ch-plugin').offsetParent",
+                300,
+            )
         except Exception:
             pass
 
         # ESC 키 눌러서 모달 닫기 시도
         await page.keyboard.press("Escape")
-        await asyncio.sleep(0.2)
+        await wait_for_condition(
+            page, "!document.querySelector('.modal.open, [role=\"dialog\"]')", 300
+        )
 
         # 일반적인 닫기 버튼 클릭 시도 (팝업/모달/쿠키 동의)
         selectors = [
@@ -117,17 +144,18 @@ async def prepare_page_for_capture(
         if wait_time > 0:
             await asyncio.sleep(wait_time)
 
-        # 애니메이션 정지 시도
+        # 애니메이션/트랜지션 정지 시도 (CSS 규칙 한 번 주입으로 전체 처리)
         if stabilize:
             try:
-                await page.evaluate(
-                    """() => {
-                    document.querySelectorAll('*').forEach(el => {
-                        if (window.getComputedStyle(el).getPropertyValue('animation-name') !== 'none') {
-                            el.style.animationPlayState = 'paused';
-                        }
-                    });
-                }"""
+                await page.add_style_tag(
+                    content="""
+                    *, *::before, *::after {
+                        animation-duration: 0s !important;
+                        animation-delay: 0s !important;
+                        transition-duration: 0s !important;
+                        transition-delay: 0s !important;
+                    }
+                    """
                 )
             except Exception:
                 pass
@@ -12,6 +12,8 @@ import os
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+import orjson
+
 from .models.models import CaptureConfig, DeviceType, CaptureResult
 from .function.capture import capture_multiple_pages
 from .utils.storage import save_metadata, create_report
@@ -22,7 +24,7 @@ def run_capture(
     urls: List[str],
     devices: List[DeviceType] = None,
     output_dir: str = "./captures",
-    wait_time: float = 2.0,
+    wait_time: float = 0.5,
     scroll_page: bool = False,
     viewport_only: bool = True,
     parallel_count: int = 3,
@@ -54,7 +56,7 @@ def run_capture(
         urls: 캡처할 URL 목록
         devices: 캡처할 디바이스 유형 목록 (기본값: [DeviceType.DESKTOP])
         output_dir: 출력 디렉토리 (기본값: ./captures)
-        wait_time: 페이지 로딩 후 대기 시간 (기본값: 2.0)
+        wait_time: 페이지 로딩 후 대기 시간 (기본값: 0.5)
         scroll_page: 페이지 스크롤 여부 (기본값: False)
         viewport_only: 뷰포트만 캡처 여부 (기본값: True)
         parallel_count: 병렬 처리 수 (기본값: 3)
@@ -107,12 +109,16 @@ def run_capture(
     if create_html_report:
         report_file = create_report(result, output_dir)
 
+    # 캡처 목록 직렬화
+    # 레코드별 model_dump() 대신 Pydantic의 JSON 직렬화(Rust 경로)를
+    # 한 번 통과시킨 뒤 orjson으로 파싱 — dict 중간 생성을 건너뛰어
+    # 대량 배치에서 후처리 시간을 크게 줄임
+    captures = orjson.loads(result.model_dump_json(include={"captures"}))["captures"]
+
     # GIF 파일 목록
     gif_files = []
     if create_gif:
-        for capture in result.captures:
-            if hasattr(capture, "gif_path") and capture.gif_path:
-                gif_files.append(capture.gif_path)
+        gif_files = [c["gif_path"] for c in captures if c.get("gif_path")]
 
     # 결과 반환 (이전 버전 호환성을 위한 딕셔너리 형태)
     return {
@@ -124,7 +130,7 @@ def run_capture(
         "output_dir": output_dir,
         "metadata_file": metadata_file,
         "report_file": report_file,
-        "captures": [capture.model_dump() for capture in result.captures],
+        "captures": captures,
         "gif_files": gif_files if create_gif else None,
     }
 
@@ -2,10 +2,12 @@
 데이터 모델 정의
 """
 
+import array
 from enum import Enum
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any, Union
 from datetime import datetime
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, PrivateAttr, computed_field
 
 
 class DeviceType(str, Enum):
@@ -16,8 +18,13 @@ class DeviceType(str, Enum):
     MOBILE = "mobile"
 
 
-class DeviceProfile(BaseModel):
-    """디바이스 프로필 정의"""
+@dataclass(frozen=True, slots=True)
+class DeviceProfile:
+    """디바이스 프로필 정의
+
+    내부 상수로만 사용되므로 Pydantic 검증 대신 불변 dataclass를 사용.
+    캡처 핫패스에서의 속성 접근이 C 레벨 슬롯 읽기로 처리됩니다.
+    """
 
     width: int
     height: int
@@ -34,7 +41,11 @@ class CaptureConfig(BaseModel):
         default=[DeviceType.DESKTOP], description="캡처할 디바이스 유형 목록"
     )
     wait_time: float = Field(
-        default=2.0, description="페이지 로딩 후 캡처 전 대기 시간(초)"
+        default=0.5, description="페이지 로딩 후 캡처 전 대기 시간(초)"
+    )
+    wait_for_selector: Optional[str] = Field(
+        default=None,
+        description="캡처 전 출현을 기다릴 CSS 선택자 (고정 대기 대신 사용 권장)",
     )
     scroll_page: bool = Field(
         default=False, description="페이지 전체를 스크롤하면서 캡처할지 여부"
@@ -64,38 +75,96 @@ class CaptureConfig(BaseModel):
     )
 
 
-class PageCapture(BaseModel):
-    """개별 페이지 캡처 정보"""
+@dataclass(frozen=True, slots=True)
+class PageCapture:
+    """개별 페이지 캡처 정보
+
+    캡처당 하나씩 대량으로 생성되어 스레드 경계를 오가는 값 객체이므로
+    검증이 필요 없는 불변 dataclass를 사용 (DeviceProfile과 동일한 이유).
+    CaptureResult의 computed 뷰를 통해 Pydantic 직렬화는 그대로 지원됩니다.
+    """
 
     url: str
     device_type: DeviceType
     file_path: str
-    timestamp: datetime = Field(default_factory=datetime.now)
     width: int
     height: int
+    timestamp: datetime = field(default_factory=datetime.now)
     success: bool = True
     error: Optional[str] = None
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
     gif_path: Optional[str] = None
 
 
 class CaptureResult(BaseModel):
-    """캡처 결과"""
+    """캡처 결과
+
+    내부 저장은 필드별 병렬 배열(SoA) 구조를 사용합니다. 수천 건의
+    배치에서 PageCapture 객체 목록 대신 동종 배열에 추가하는 편이
+    메모리 지역성과 직렬화 비용 면에서 유리하며, `captures`는 기존
+    호환성을 위해 필요 시 재구성되는 읽기 전용 뷰입니다.
+    """
 
-    captures: List[PageCapture] = Field(default_factory=list)
-    success_count: int = 0
-    error_count: int = 0
     start_time: datetime = Field(default_factory=datetime.now)
     end_time: Optional[datetime] = None
     total_duration: Optional[float] = None  # 초 단위
 
+    # 캡처별 병렬 배열 (숫자/불리언 필드는 C 배열로 압축 저장)
+    _urls: List[str] = PrivateAttr(default_factory=list)
+    _device_types: List[DeviceType] = PrivateAttr(default_factory=list)
+    _file_paths: List[str] = PrivateAttr(default_factory=list)
+    _timestamps: List[datetime] = PrivateAttr(default_factory=list)
+    _widths: array.array = PrivateAttr(default_factory=lambda: array.array("i"))
+    _heights: array.array = PrivateAttr(default_factory=lambda: array.array("i"))
+    _success: array.array = PrivateAttr(default_factory=lambda: array.array("b"))
+    _errors: List[Optional[str]] = PrivateAttr(default_factory=list)
+    _metadata: List[Dict[str, Any]] = PrivateAttr(default_factory=list)
+    _gif_paths: List[Optional[str]] = PrivateAttr(default_factory=list)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def success_count(self) -> int:
+        """성공한 캡처 수 (성공 배열에서 필요 시 집계)"""
+        return sum(self._success)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def error_count(self) -> int:
+        """실패한 캡처 수"""
+        return len(self._success) - sum(self._success)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def captures(self) -> List[PageCapture]:
+        """병렬 배열로부터 재구성한 캡처 목록 (읽기 전용 뷰)"""
+        return [
+            PageCapture(
+                url=self._urls[i],
+                device_type=self._device_types[i],
+                file_path=self._file_paths[i],
+                timestamp=self._timestamps[i],
+                width=self._widths[i],
+                height=self._heights[i],
+                success=bool(self._success[i]),
+                error=self._errors[i],
+                metadata=self._metadata[i],
+                gif_path=self._gif_paths[i],
+            )
+            for i in range(len(self._urls))
+        ]
+
     def add_capture(self, capture: PageCapture):
         """캡처 결과 추가"""
-        self.captures.append(capture)
-        if capture.success:
-            self.success_count += 1
-        else:
-            self.error_count += 1
+        self._urls.append(capture.url)
+        self._device_types.append(capture.device_type)
+        self._file_paths.append(capture.file_path)
+        self._timestamps.append(capture.timestamp)
+        self._widths.append(capture.width)
+        self._heights.append(capture.height)
+        self._success.append(1 if capture.success else 0)
+        self._errors.append(capture.error)
+        self._metadata.append(capture.metadata)
+        self._gif_paths.append(capture.gif_path)
 
     def complete(self):
         """캡처 작업 완료 처리"""
@@ -5,114 +5,184 @@
 import os
 import time
 import queue
-import threading
+from datetime import datetime
+import collections
+import concurrent.futures
+from dataclasses import dataclass, field, replace
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Callable, Optional
 
 from ..config.config import logger
 from ..models.models import DeviceType, CaptureResult, PageCapture
+from .storage import BatchImageWriter
+from .utils import normalize_url, _url_hash, _netloc
 
 
+@dataclass(frozen=True, slots=True)
 class CaptureTask:
-    """캡처 작업 정의"""
-
-    def __init__(self, url: str, device_type: DeviceType, output_dir: str):
-        self.url = url
-        self.device_type = device_type
-        self.output_dir = output_dir
-        self.timestamp = time.time()
+    """캡처 작업 정의
+
+    수천 개씩 생성되는 값 객체이므로 인스턴스 __dict__ 없는 불변
+    dataclass를 사용 (PageCapture/DeviceProfile과 동일한 이유).
+    url_hash/domain은 파일명 생성 등에 쓰이는 URL 파생값으로,
+    같은 URL이 디바이스 수만큼 작업으로 확장될 때 재계산하지 않도록
+    생성 시점에 한 번만 계산해 담아둡니다.
+    """
+
+    url: str
+    device_type: DeviceType
+    output_dir: str
+    url_hash: Optional[str] = None
+    domain: Optional[str] = None
+    # 배치 전체가 공유하는 파일명 타임스탬프 (큐가 제출 시점에 채움)
+    batch_timestamp: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+
+    def __post_init__(self):
+        if self.url_hash is None:
+            object.__setattr__(self, "url_hash", _url_hash(self.url))
+        if self.domain is None:
+            object.__setattr__(self, "domain", _netloc(self.url))
 
 
 class CaptureQueue:
-    """캡처 작업 큐"""
+    """캡처 작업 큐
+
+    작업 실행은 ThreadPoolExecutor에 위임합니다. 수동 작업자 스레드가
+    1초 타임아웃으로 큐를 폴링하던 방식과 달리 유휴 시 깨어나지 않고,
+    종료도 shutdown() 한 번으로 처리됩니다.
+    """
 
     def __init__(self, max_workers: int = 3):
-        self.queue = queue.Queue()
+        # 시작 전 추가된 작업의 버퍼 (start 시 일괄 제출)
+        # task_done/join 의미론이 필요 없으므로 C로 구현된 SimpleQueue 사용
+        self.queue = queue.SimpleQueue()
         self.max_workers = max_workers
-        self.workers = []
-        self.running = False
         self.result = CaptureResult()
-        self.lock = threading.Lock()
+        # 작업자들이 완료 결과를 쌓는 중간 버퍼
+        # deque.append는 CPython에서 원자적이므로 잠금 없이 안전
+        self._pending: "collections.deque[PageCapture]" = collections.deque()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: List[concurrent.futures.Future] = []
+        # 이미지 쓰기 전용 풀 (캡처 작업자와 디스크 I/O를 파이프라인화)
+        self._image_writer: Optional[BatchImageWriter] = None
+        # 배치 전체가 공유하는 타임스탬프 (start 시점에 고정)
+        self.batch_ts: Optional[str] = None
+        self._process_func: Optional[
+            Callable[[CaptureTask], Optional[PageCapture]]
+        ] = None
 
     def add_task(self, task: CaptureTask):
-        """큐에 작업 추가"""
-        self.queue.put(task)
+        """큐에 작업 추가 (실행 중이면 즉시 제출)"""
+        if self._executor is not None:
+            if task.batch_timestamp is None:
+                task = replace(task, batch_timestamp=self.batch_ts)
+            self._futures.append(self._executor.submit(self._run_task, task))
+        else:
+            self.queue.put(task)
         logger.debug(f"작업 추가: {task.url} ({task.device_type})")
 
     def add_tasks_from_urls(
         self, urls: List[str], device_types: List[DeviceType], output_dir: str
     ):
-        """URL 목록에서 작업 추가"""
+        """URL 목록에서 작업 추가
+
+        정규화/해시/도메인 추출은 URL당 한 번만 수행하고
+        디바이스별 작업에는 계산된 값을 전달합니다.
+        """
         for url in urls:
+            url = normalize_url(url)
+            url_hash = _url_hash(url)
+            domain = _netloc(url)
             for device_type in device_types:
-                self.add_task(CaptureTask(url, device_type, output_dir))
+                self.add_task(
+                    CaptureTask(
+                        url,
+                        device_type,
+                        output_dir,
+                        url_hash=url_hash,
+                        domain=domain,
+                    )
+                )
 
         logger.info(f"{len(urls) * len(device_types)}개 작업 추가 완료")
 
     def add_capture_result(self, capture: PageCapture):
-        """캡처 결과 추가 (스레드 안전)"""
-        with self.lock:
-            self.result.add_capture(capture)
-
-    def _worker(
-        self,
-        worker_id: int,
-        process_func: Callable[[CaptureTask], Optional[PageCapture]],
-    ):
-        """작업자 스레드"""
-        logger.info(f"작업자 {worker_id} 시작")
-
-        while self.running:
-            try:
-                # 큐에서 작업 가져오기 (1초 타임아웃)
-                task = self.queue.get(timeout=1)
-
-                # 작업 처리
-                logger.debug(
-                    f"작업자 {worker_id}가 작업 처리 중: {task.url} ({task.device_type})"
-                )
-                try:
-                    capture_result = process_func(task)
-                    if capture_result:
-                        self.add_capture_result(capture_result)
-                except Exception as e:
-                    logger.error(f"작업자 {worker_id} 오류: {str(e)}")
-
-                # 작업 완료 표시
-                self.queue.task_done()
-
-            except queue.Empty:
-                pass  # 큐가 비어있으면 계속 진행
-
-        logger.info(f"작업자 {worker_id} 종료")
+        """캡처 결과 추가 (잠금 없이 스레드 안전)
+
+        뮤텍스 대신 deque에 쌓아두고 stop()에서 한 번에 병합합니다.
+        작업자 수만큼 경합하던 lock acquire/release가 사라집니다.
+        """
+        self._pending.append(capture)
+
+    def save_image_async(self, image_data: bytes, output_path: str):
+        """이미지 쓰기를 전용 I/O 풀에 위임 (작업자는 즉시 다음 작업으로)
+
+        I/O 풀은 첫 제출 시점에 지연 생성되며 (사용하지 않는 실행에서는
+        스레드가 만들어지지 않음), 제출된 쓰기는 stop() 시점에 일괄
+        완료를 보장합니다.
+        """
+        if self._image_writer is None:
+            self._image_writer = BatchImageWriter(max_workers=2)
+        return self._image_writer.submit(image_data, output_path)
+
+    def _run_task(self, task: CaptureTask):
+        """단일 작업 처리 (작업자 스레드에서 실행)"""
+        logger.debug(f"작업 처리 중: {task.url} ({task.device_type})")
+        try:
+            capture_result = self._process_func(task)
+            if capture_result:
+                self.add_capture_result(capture_result)
+        except Exception as e:
+            logger.error(f"작업 처리 오류: {str(e)}")
 
     def start(self, process_func: Callable[[CaptureTask], Optional[PageCapture]]):
         """작업 큐 시작"""
-        if self.running:
+        if self._executor is not None:
             logger.warning("작업 큐가 이미 실행 중입니다.")
             return
 
-        self.running = True
         self.result = CaptureResult()
+        self._pending.clear()
+        self._process_func = process_func
+        # 파일명/메타데이터가 공유할 배치 타임스탬프를 한 번만 계산
+        self.batch_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._futures = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="capture"
+        )
 
-        # 작업자 시작
-        for i in range(self.max_workers):
-            worker = threading.Thread(target=self._worker, args=(i + 1, process_func))
-            worker.daemon = True
-            worker.start()
-            self.workers.append(worker)
+        # 시작 전 버퍼에 쌓인 작업 일괄 제출 (배치 타임스탬프 주입)
+        while True:
+            try:
+                task = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if task.batch_timestamp is None:
+                task = replace(task, batch_timestamp=self.batch_ts)
+            self._futures.append(self._executor.submit(self._run_task, task))
 
         logger.info(f"{self.max_workers}개 작업자 시작")
 
     def stop(self):
         """작업 큐 중지"""
         logger.info("작업 큐 중지 중...")
-        self.running = False
 
-        # 모든 작업자 종료 대기
-        for worker in self.workers:
-            worker.join(timeout=5)
+        if self._executor is not None:
+            # 진행 중인 작업은 완료를 기다리고 미시작 작업은 취소
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._futures = []
 
-        self.workers = []
+        # 위임된 이미지 쓰기 완료 대기 (메타데이터/보고서 생성 전에 보장)
+        if self._image_writer is not None:
+            self._image_writer.flush()
+            self._image_writer.close()
+            self._image_writer = None
+
+        # 쌓인 결과를 한 번에 병합 (작업자 종료 후라 경합 없음)
+        while self._pending:
+            self.result.add_capture(self._pending.popleft())
 
         # 결과 완료 처리
         self.result.complete()
@@ -123,9 +193,13 @@ class CaptureQueue:
     def wait(self, timeout: Optional[float] = None):
         """모든 작업 완료까지 대기"""
         try:
-            self.queue.join()
+            for _ in concurrent.futures.as_completed(self._futures, timeout=timeout):
+                pass
             logger.info("모든 작업 완료")
             return True
+        except concurrent.futures.TimeoutError:
+            logger.warning("작업 완료 대기 시간 초과")
+            return False
         except KeyboardInterrupt:
             logger.warning("작업 중단됨")
             return False
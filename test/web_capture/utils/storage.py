@@ -3,8 +3,9 @@
 """
 
 import os
-import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from html import escape
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -12,6 +13,66 @@ from ..config.config import logger
 from ..models.models import CaptureResult, PageCapture
 from .utils import ensure_dir
 
+# 이미 생성을 확인한 디렉토리 집합
+# 캡처마다 os.makedirs가 내는 stat/mkdir 시스템 콜을 생략
+# (set.add는 GIL 하에서 원자적이므로 작업자 스레드 간 안전)
+_dir_cache: set = set()
+
+# 보고서 행 템플릿 (루프 안에서 f-string을 새로 조립하지 않도록 모듈 상수로)
+_REPORT_ROW = (
+    "<tr>"
+    "<td>{url}</td>"
+    "<td>{dev}</td>"
+    "<td class='{cls}'>{status}</td>"
+    "{file_cell}"
+    "<td>{ts}</td>"
+    "</tr>"
+)
+
+# Jinja2 보고서 템플릿 소스 (행 루프 포함 전체 문서)
+# import 시점에 파이썬 바이트코드로 컴파일되고 autoescape가
+# HTML 이스케이프를 대신 처리
+_REPORT_HTML = """<html><head>\
+<meta charset='utf-8'>\
+<title>웹 캡처 보고서</title>\
+<style>\
+body { font-family: Arial, sans-serif; margin: 20px; }\
+h1 { color: #333; }\
+table { border-collapse: collapse; width: 100%; }\
+th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }\
+th { background-color: #f2f2f2; }\
+tr:nth-child(even) { background-color: #f9f9f9; }\
+.success { color: green; }\
+.error { color: red; }\
+</style>\
+</head><body>\
+<h1>웹 캡처 보고서</h1>\
+<p>생성 시간: {{ result.end_time }}</p>\
+<p>총 캡처: {{ result.success_count + result.error_count }}</p>\
+<p>성공: {{ result.success_count }} / 실패: {{ result.error_count }}</p>\
+<p>소요 시간: {{ '%.2f' % result.total_duration }}초</p>\
+<h2>캡처 결과</h2>\
+<table>\
+<tr><th>URL</th><th>디바이스</th><th>상태</th><th>파일</th><th>시간</th></tr>\
+{% for row in rows %}<tr>\
+<td>{{ row.url }}</td>\
+<td>{{ row.dev }}</td>\
+<td class='{{ row.cls }}'>{{ row.status }}</td>\
+{% if row.rel_path %}<td><a href='{{ row.rel_path }}'>{{ row.filename }}</a></td>\
+{% else %}<td>-</td>{% endif %}\
+<td>{{ row.ts }}</td>\
+</tr>{% endfor %}\
+</table>\
+</body></html>"""
+
+# Jinja2가 있으면 한 번 컴파일해두고, 없으면 문자열 조립 경로 사용
+try:
+    import jinja2
+
+    _REPORT_TMPL = jinja2.Environment(autoescape=True).from_string(_REPORT_HTML)
+except ImportError:
+    _REPORT_TMPL = None
+
 
 def save_image(image_data: bytes, output_path: str) -> bool:
     """
@@ -25,12 +86,23 @@ def save_image(image_data: bytes, output_path: str) -> bool:
         성공 여부
     """
     try:
-        # 디렉토리 확인
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        # 디렉토리 확인 (최초 1회만 시스템 콜 발생)
+        directory = os.path.dirname(output_path)
+        if directory not in _dir_cache:
+            os.makedirs(directory, exist_ok=True)
+            _dir_cache.add(directory)
 
         # 이미지 저장
-        with open(output_path, "wb") as f:
-            f.write(image_data)
+        # 버퍼드 writer가 큰 블롭을 잘게 쪼개 쓰지 않도록 os.write로 직접 기록
+        # (수백 KB~수 MB 스크린샷이 보통 시스템 콜 한 번에 나감)
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(image_data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
 
         logger.debug(f"이미지 저장 완료: {output_path}")
         return True
@@ -40,13 +112,53 @@ def save_image(image_data: bytes, output_path: str) -> bool:
         return False
 
 
-def save_metadata(result: CaptureResult, output_dir: str) -> str:
+class BatchImageWriter:
+    """이미지 일괄 기록기
+
+    배치 캡처에서는 여러 캡처가 거의 동시에 끝나면서 이미지 쓰기가
+    몰립니다. (경로, 바이트) 쌍을 제출받아 작은 전용 스레드 풀에서
+    병렬로 기록하므로 캡처 작업자가 디스크 I/O에 붙잡히지 않습니다.
+
+    사용 후 flush()로 전체 완료를 기다리거나 close()로 풀을 정리합니다.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="imgwrite"
+        )
+        self._futures: List[Future] = []
+
+    def submit(self, image_data: bytes, output_path: str) -> Future:
+        """이미지 쓰기 제출 (즉시 반환)"""
+        future = self._executor.submit(save_image, image_data, output_path)
+        self._futures.append(future)
+        return future
+
+    def flush(self) -> bool:
+        """제출된 모든 쓰기 완료 대기
+
+        Returns:
+            모든 쓰기 성공 여부
+        """
+        futures, self._futures = self._futures, []
+        return all(f.result() for f in futures)
+
+    def close(self):
+        """기록기 종료 (남은 쓰기는 완료 후 정리)"""
+        self._executor.shutdown(wait=True)
+
+
+def save_metadata(
+    result: CaptureResult, output_dir: str, timestamp: Optional[str] = None
+) -> str:
     """
     캡처 결과 메타데이터 저장
 
     Args:
         result: 캡처 결과
         output_dir: 저장 디렉토리
+        timestamp: 파일명에 쓸 타임스탬프 문자열 (None이면 현재 시각,
+            배치의 캡처 파일들과 같은 시각으로 묶으려면 배치 값을 전달)
 
     Returns:
         저장된 메타데이터 파일 경로
@@ -56,15 +168,16 @@ def save_metadata(result: CaptureResult, output_dir: str) -> str:
         ensure_dir(output_dir)
 
         # 메타데이터 파일명 생성
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         metadata_file = os.path.join(output_dir, f"metadata_{timestamp}.json")
 
-        # Pydantic 모델을 dict로 변환
-        metadata = result.model_dump()
-
         # JSON으로 저장
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2, default=str)
+        # model_dump() + 재직렬화 대신 pydantic-core(Rust)의 JSON 경로를
+        # 직접 사용 — 중간 파이썬 dict 생성 자체를 건너뜀
+        payload = result.model_dump_json(indent=2).encode("utf-8")
+        with open(metadata_file, "wb", buffering=1 << 16) as f:
+            f.write(payload)
 
         logger.info(f"메타데이터 저장 완료: {metadata_file}")
         return metadata_file
@@ -74,13 +187,16 @@ def save_metadata(result: CaptureResult, output_dir: str) -> str:
         return ""
 
 
-def create_report(result: CaptureResult, output_dir: str) -> str:
+def create_report(
+    result: CaptureResult, output_dir: str, timestamp: Optional[str] = None
+) -> str:
     """
     캡처 결과 보고서 생성
 
     Args:
         result: 캡처 결과
         output_dir: 저장 디렉토리
+        timestamp: 파일명에 쓸 타임스탬프 문자열 (None이면 현재 시각)
 
     Returns:
         생성된 보고서 파일 경로
@@ -90,63 +206,110 @@ def create_report(result: CaptureResult, output_dir: str) -> str:
         ensure_dir(output_dir)
 
         # 보고서 파일명 생성
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_file = os.path.join(output_dir, f"report_{timestamp}.html")
 
-        # 간단한 HTML 보고서 생성
-        with open(report_file, "w", encoding="utf-8") as f:
-            f.write("<html><head>")
-            f.write("<meta charset='utf-8'>")
-            f.write("<title>웹 캡처 보고서</title>")
-            f.write("<style>")
-            f.write("body { font-family: Arial, sans-serif; margin: 20px; }")
-            f.write("h1 { color: #333; }")
-            f.write("table { border-collapse: collapse; width: 100%; }")
-            f.write(
-                "th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }"
+        # 행 데이터 선계산 (렌더링 경로와 무관하게 한 번만)
+        _basename = os.path.basename
+        _relpath = os.path.relpath
+        rows = []
+        for capture in result.captures:
+            success = capture.success
+            if success:
+                file_path = capture.file_path
+                filename = _basename(file_path)
+                rel_path = _relpath(file_path, output_dir)
+            else:
+                filename = rel_path = None
+            rows.append(
+                {
+                    "url": capture.url,
+                    "dev": capture.device_type,
+                    "cls": "success" if success else "error",
+                    "status": "성공" if success else f"실패: {capture.error or ''}",
+                    "filename": filename,
+                    "rel_path": rel_path,
+                    "ts": capture.timestamp,
+                }
             )
-            f.write("th { background-color: #f2f2f2; }")
-            f.write("tr:nth-child(even) { background-color: #f9f9f9; }")
-            f.write(".success { color: green; }")
-            f.write(".error { color: red; }")
-            f.write("</style>")
-            f.write("</head><body>")
 
+        # Jinja2가 있으면 컴파일된 템플릿으로 한 번에 렌더링
+        # (autoescape가 URL/오류 메시지 이스케이프를 처리)
+        if _REPORT_TMPL is not None:
+            with open(report_file, "w", encoding="utf-8", buffering=1 << 16) as f:
+                f.write(_REPORT_TMPL.render(result=result, rows=rows))
+
+            logger.info(f"보고서 생성 완료: {report_file}")
+            return report_file
+
+        # 폴백: 문자열 조각을 리스트에 모아 마지막에 한 번만 write
+        # (행마다 f.write를 수십 번 호출하면 io 계층 통과 비용이 O(N*필드) 발생)
+        parts = [
+            "<html><head>",
+            "<meta charset='utf-8'>",
+            "<title>웹 캡처 보고서</title>",
+            "<style>",
+            "body { font-family: Arial, sans-serif; margin: 20px; }",
+            "h1 { color: #333; }",
+            "table { border-collapse: collapse; width: 100%; }",
+            "th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }",
+            "th { background-color: #f2f2f2; }",
+            "tr:nth-child(even) { background-color: #f9f9f9; }",
+            ".success { color: green; }",
+            ".error { color: red; }",
+            "</style>",
+            "</head><body>",
             # 제목 및 요약
-            f.write("<h1>웹 캡처 보고서</h1>")
-            f.write(f"<p>생성 시간: {result.end_time}</p>")
-            f.write(f"<p>총 캡처: {result.success_count + result.error_count}</p>")
-            f.write(f"<p>성공: {result.success_count} / 실패: {result.error_count}</p>")
-            f.write(f"<p>소요 시간: {result.total_duration:.2f}초</p>")
-
+            "<h1>웹 캡처 보고서</h1>",
+            f"<p>생성 시간: {result.end_time}</p>",
+            f"<p>총 캡처: {result.success_count + result.error_count}</p>",
+            f"<p>성공: {result.success_count} / 실패: {result.error_count}</p>",
+            f"<p>소요 시간: {result.total_duration:.2f}초</p>",
             # 캡처 결과 표
-            f.write("<h2>캡처 결과</h2>")
-            f.write("<table>")
-            f.write(
-                "<tr><th>URL</th><th>디바이스</th><th>상태</th><th>파일</th><th>시간</th></tr>"
+            "<h2>캡처 결과</h2>",
+            "<table>",
+            "<tr><th>URL</th><th>디바이스</th><th>상태</th><th>파일</th><th>시간</th></tr>",
+        ]
+        # 루프 불변 바인딩 (행마다 전역/모듈 속성 조회 제거)
+        append = parts.append
+        row_format = _REPORT_ROW.format
+
+        # 외부 입력(URL/오류 메시지/파일명)은 HTML 이스케이프 필수
+        # 같은 URL이 디바이스 수만큼 반복되므로 이스케이프 결과를 캐시
+        esc_cache: Dict[str, str] = {}
+
+        def esc(s: str) -> str:
+            cached = esc_cache.get(s)
+            if cached is None:
+                cached = esc_cache[s] = escape(s, quote=True)
+            return cached
+
+        for row in rows:
+            rel_path = row["rel_path"]
+            if rel_path is not None:
+                file_cell = (
+                    f"<td><a href='{esc(rel_path)}'>{esc(row['filename'])}</a></td>"
+                )
+            else:
+                file_cell = "<td>-</td>"
+
+            append(
+                row_format(
+                    url=esc(row["url"]),
+                    dev=row["dev"],
+                    cls=row["cls"],
+                    status=esc(row["status"]),
+                    file_cell=file_cell,
+                    ts=row["ts"],
+                )
             )
 
-            for capture in result.captures:
-                status_class = "success" if capture.success else "error"
-                status_text = "성공" if capture.success else f"실패: {capture.error}"
-
-                f.write("<tr>")
-                f.write(f"<td>{capture.url}</td>")
-                f.write(f"<td>{capture.device_type}</td>")
-                f.write(f"<td class='{status_class}'>{status_text}</td>")
-
-                if capture.success:
-                    filename = os.path.basename(capture.file_path)
-                    rel_path = os.path.relpath(capture.file_path, output_dir)
-                    f.write(f"<td><a href='{rel_path}'>{filename}</a></td>")
-                else:
-                    f.write("<td>-</td>")
-
-                f.write(f"<td>{capture.timestamp}</td>")
-                f.write("</tr>")
+        append("</table>")
+        append("</body></html>")
 
-            f.write("</table>")
-            f.write("</body></html>")
+        with open(report_file, "w", encoding="utf-8", buffering=1 << 16) as f:
+            f.write("".join(parts))
 
         logger.info(f"보고서 생성 완료: {report_file}")
         return report_file
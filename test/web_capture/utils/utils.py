@@ -5,13 +5,37 @@
 import os
 import re
 import hashlib
+from functools import lru_cache
 from urllib.parse import urlparse
-from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Optional, Union
 
 from ..config.config import logger
 
+# 핫패스에서 쓰는 정규식은 import 시점에 컴파일
+# (re 모듈 캐시 조회조차 URL당 반복 비용이 됨)
+_PROTO_RE = re.compile(r"^https?://")
+_BADCHARS_RE = re.compile(r'[\\/*?:"<>|]')
+
+
+@lru_cache(maxsize=4096)
+def _url_hash(url: str) -> str:
+    """파일명 구분용 URL 해시 (비암호학적 용도)
+
+    MD5보다 빠른 blake2b를 8자리(4바이트)로 잘라 사용하며,
+    같은 URL이 디바이스 수만큼 반복 해시되지 않도록 캐시합니다.
+    """
+    return hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """URL의 도메인 부분 추출 (캐시됨)
+
+    urlparse는 URL당 비용이 제법 크므로 반복 호출을 캐시로 흡수합니다.
+    """
+    return urlparse(url).netloc.replace("www.", "")
+
 
 def normalize_url(url: str) -> str:
     """
@@ -23,20 +47,23 @@ def normalize_url(url: str) -> str:
     Returns:
         정규화된 URL
     """
-    # URL에 프로토콜이 없는 경우 추가
-    if not url.startswith(("http://", "https://")):
-        url = f"https://{url}"
+    # 스킴이 이미 있으면 urlparse 없이 경로 유무만 확인
+    # (호스트 뒤에 슬래시가 없으면 추가 — 정규화된 입력이 대부분인
+    # 핫패스에서 urlparse의 분리/검증 비용을 생략)
+    if url.startswith("https://"):
+        return url if url.find("/", 8) != -1 else f"{url}/"
+    if url.startswith("http://"):
+        return url if url.find("/", 7) != -1 else f"{url}/"
 
-    # URL 끝에 슬래시 추가
-    parsed = urlparse(url)
-    if not parsed.path:
-        url = f"{url}/"
-
-    return url
+    # URL에 프로토콜이 없는 경우 추가 후 경로 확인
+    return f"https://{url}" if "/" in url else f"https://{url}/"
 
 
 def generate_filename(
-    url: str, device_type: str, template: str = "{timestamp}_{device}_{url_hash}"
+    url: str,
+    device_type: str,
+    template: str = "{timestamp}_{device}_{url_hash}",
+    timestamp: Optional[str] = None,
 ) -> str:
     """
     캡처 파일 이름 생성
@@ -45,13 +72,16 @@ def generate_filename(
         url: 캡처할 URL
         device_type: 디바이스 유형
         template: 파일명 템플릿
+        timestamp: 타임스탬프 문자열 (None이면 현재 시각으로 생성,
+            배치 작업에서는 한 번 계산한 값을 전달하는 것이 좋음)
 
     Returns:
         생성된 파일명 (확장자 제외)
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-    domain = urlparse(url).netloc.replace("www.", "")
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    url_hash = _url_hash(url)
+    domain = _netloc(url)
 
     # 템플릿 적용
     filename = template.format(
@@ -62,24 +92,32 @@ def generate_filename(
     )
 
     # 파일명에 유효하지 않은 문자 제거
-    filename = re.sub(r'[\\/*?:"<>|]', "", filename)
+    filename = _BADCHARS_RE.sub("", filename)
 
     return filename
 
 
+# ensure_dir가 이미 확인한 디렉토리 집합 (set.add는 GIL 하에서 원자적)
+_ensured: set = set()
+
+
 def ensure_dir(directory: str) -> str:
     """
     디렉토리가 존재하는지 확인하고, 없으면 생성합니다.
 
+    캡처마다 호출되는 핫패스이므로 Path 객체 생성 없이 os.makedirs를
+    사용하고, 한 번 확인한 디렉토리는 시스템 콜 없이 바로 반환합니다.
+
     Args:
         directory: 확인할 디렉토리 경로
 
     Returns:
         생성된 디렉토리 경로
     """
-    path = Path(directory)
-    path.mkdir(parents=True, exist_ok=True)
-    return str(path)
+    if directory not in _ensured:
+        os.makedirs(directory, exist_ok=True)
+        _ensured.add(directory)
+    return directory
 
 
 def clean_url_for_display(url: str, max_length: int = 50) -> str:
@@ -94,7 +132,7 @@ def clean_url_for_display(url: str, max_length: int = 50) -> str:
         정리된 URL
     """
     # 프로토콜 제거
-    cleaned = re.sub(r"^https?://", "", url)
+    cleaned = _PROTO_RE.sub("", url)
 
     # 길이 제한
     if len(cleaned) > max_length:
@@ -113,15 +151,18 @@ def parse_url_list(input_file: str) -> List[str]:
     Returns:
         URL 목록
     """
-    urls = []
-
     try:
-        with open(input_file, "r", encoding="utf-8") as f:
-            for line in f:
-                # 주석 및 빈 줄 제외
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    urls.append(line)
+        # 파일 전체를 한 번에 읽고 리스트 컴프리헨션으로 처리
+        # (라인별 파이썬 루프 대신 C 레벨 splitlines/필터링 사용)
+        with open(input_file, "rb") as f:
+            data = f.read()
+
+        # 주석 및 빈 줄 제외
+        urls = [
+            line
+            for line in (raw.strip() for raw in data.decode("utf-8").splitlines())
+            if line and not line.startswith("#")
+        ]
 
         logger.info(f"{len(urls)}개의 URL을 로드했습니다.")
         return urls